@@ -1,6 +1,6 @@
 """Defines the base dialect class."""
 
-from typing import Union, Type
+from typing import Dict, Tuple, Union, Type
 
 from sqlfluff.core.parser import (
     KeywordSegment,
@@ -43,6 +43,8 @@ class Dialect:
         self._sets = sets or {}
         self.inherits_from = inherits_from
         self.root_segment_name = root_segment_name
+        # Lookups of bracket pairs by type, built on first use.
+        self._bracket_pair_lookups: Dict[str, Dict[str, Tuple[str, str, bool]]] = {}
 
     def __repr__(self):
         return f"<Dialect: {self.name}>"
@@ -235,6 +237,39 @@ class Dialect:
                 )
             )
 
+    def get_bracket_pair(
+        self, bracket_type: str, bracket_pairs_set: str = "bracket_pairs"
+    ) -> Tuple[str, str, bool]:
+        """Return the start and end refs, and persistence, for a bracket type.
+
+        The bracket pairs sets hold tuples of (bracket_type, start_ref,
+        end_ref, persists). Rather than scanning the set on every lookup,
+        a dict keyed on bracket_type is built the first time each set is
+        used. As with `ref`, this requires the dialect to be expanded, after
+        which the sets shouldn't change.
+        """
+        if not self.expanded:
+            raise RuntimeError("Dialect must be expanded before use.")
+
+        try:
+            lookup = self._bracket_pair_lookups[bracket_pairs_set]
+        except KeyError:
+            lookup = {
+                bracket_type: (start_ref, end_ref, persists)
+                for bracket_type, start_ref, end_ref, persists in self.sets(
+                    bracket_pairs_set
+                )
+            }
+            self._bracket_pair_lookups[bracket_pairs_set] = lookup
+
+        if bracket_type not in lookup:
+            raise ValueError(
+                "bracket_type {!r} not found in {} of {!r} dialect.".format(
+                    bracket_type, bracket_pairs_set, self.name
+                )
+            )
+        return lookup[bracket_type]
+
     def set_lexer_matchers(self, lexer_matchers):
         """Set the lexer struct for the dialect.
 
@@ -192,7 +192,8 @@ class Linter:
 
         if parsed:
             linter_logger.info("\n###\n#\n# {}\n#\n###".format("Parsed Tree:"))
-            linter_logger.info("\n" + parsed.stringify())
+            if linter_logger.isEnabledFor(logging.INFO):
+                linter_logger.info("\n" + parsed.stringify())
             # We may succeed parsing, but still have unparsable segments. Extract them here.
             for unparsable in parsed.iter_unparsables():
                 # No exception has been raised explicitly, but we still create one here
@@ -209,7 +210,8 @@ class Linter:
                     )
                 )
                 linter_logger.info("Found unparsable segment...")
-                linter_logger.info(unparsable.stringify())
+                if linter_logger.isEnabledFor(logging.INFO):
+                    linter_logger.info(unparsable.stringify())
         return parsed, violations
 
     @staticmethod
@@ -36,6 +36,10 @@ class RootParseContext:
         self.indentation_config = indentation_config or {}
         # Initialise the blacklist
         self.blacklist = ParseBlacklist()
+        # Segments made by parsers during this parse, so that they can
+        # be reused if the same raw segment is matched again. Keyed by
+        # the ids of the parser and the raw segment.
+        self.parser_matches = {}
         # This is the logger that child objects will latch onto.
         self.logger = parser_logger
         # A uuid for this parse context to enable cache invalidation
@@ -80,7 +84,8 @@ class RootParseContext:
 
     def __exit__(self, type, value, traceback):
         """Clear up the context."""
-        pass
+        # Drop references to the segments of this parse.
+        self.parser_matches = {}
 
 
 class ParseContext:
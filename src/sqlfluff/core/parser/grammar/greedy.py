@@ -178,6 +178,22 @@ class StartsWith(GreedyUntil):
             # We've trying to match on a sequence of segments which contain no code.
             # That means this isn't a match.
             return MatchResult.from_unmatched(segments)
+
+        # If the target is simple, we can rule it out on the first
+        # code element alone, without the cost of a full match.
+        simple = self.simple(parse_context=parse_context)
+        if simple:
+            first_raw = next(
+                (
+                    raw
+                    for raw in segments[first_code_idx].iter_raw_seg()
+                    if raw.is_code
+                ),
+                None,
+            )
+            if not first_raw or first_raw.raw_upper not in simple:
+                return MatchResult.from_unmatched(segments)
+
         with parse_context.deeper_match() as ctx:
             match = self.target.match(
                 segments=segments[first_code_idx:], parse_context=ctx
@@ -213,19 +213,11 @@ class Bracketed(Sequence):
 
     def get_bracket_from_dialect(self, parse_context):
         """Rehydrate the bracket segments in question."""
-        for bracket_type, start_ref, end_ref, persists in parse_context.dialect.sets(
-            self.bracket_pairs_set
-        ):
-            if bracket_type == self.bracket_type:
-                start_bracket = parse_context.dialect.ref(start_ref)
-                end_bracket = parse_context.dialect.ref(end_ref)
-                break
-        else:
-            raise ValueError(
-                "bracket_type {!r} not found in bracket_pairs of {!r} dialect.".format(
-                    self.bracket_type, parse_context.dialect.name
-                )
-            )
+        start_ref, end_ref, persists = parse_context.dialect.get_bracket_pair(
+            self.bracket_type, self.bracket_pairs_set
+        )
+        start_bracket = parse_context.dialect.ref(start_ref)
+        end_bracket = parse_context.dialect.ref(end_ref)
         return start_bracket, end_bracket, persists
 
     @match_wrapper()
@@ -1,7 +1,7 @@
 """The code for the Lexer."""
 
 import logging
-from typing import Optional, List, Tuple, Union, NamedTuple
+from typing import Callable, Optional, List, Pattern, Tuple, Union, NamedTuple
 import re
 
 from sqlfluff.core.parser.segments import (
@@ -70,7 +70,7 @@ class StringLexer:
     def __init__(
         self,
         name,
-        template,
+        template: str,
         segment_class,
         subdivider=None,
         trim_post_subdivide=None,
@@ -215,17 +215,51 @@ class StringLexer:
 
 
 class RegexLexer(StringLexer):
-    """This RegexLexer matches based on regular expressions."""
+    """This RegexLexer matches based on regular expressions.
+
+    Optionally a `match_fn` can be provided, which is used in place of
+    the regex when matching. It is called with the string and a start
+    position and should return the end position of the match, or -1 if
+    there isn't one. This allows hand written scanners for tokens where
+    a regex would be expensive. The regex is still used for `search`.
+
+    The template may also be an already compiled pattern, which is used
+    as is. Note that string templates are compiled with `re.DOTALL`, so
+    that newlines are matched by `.`, but a compiled pattern only has
+    the flags it was compiled with.
+    """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # We might want to configure this at some point, but for now, newlines
-        # do get matched by .
-        flags = re.DOTALL
-        self._compiled_regex = re.compile(self.template, flags)
+    def __init__(
+        self,
+        name: str,
+        template: Union[str, Pattern[str]],
+        segment_class,
+        *args,
+        match_fn: Optional[Callable[[str, int], int]] = None,
+        **kwargs,
+    ):
+        if isinstance(template, str):
+            # We might want to configure this at some point, but for now, newlines
+            # do get matched by .
+            flags = re.DOTALL
+            self._compiled_regex = re.compile(template, flags)
+        else:
+            # Already compiled (e.g. at module level in a dialect), so
+            # use it as is rather than compiling it again.
+            self._compiled_regex = template
+        # The template is kept as the pattern string for reference.
+        super().__init__(
+            name, self._compiled_regex.pattern, segment_class, *args, **kwargs
+        )
+        self.match_fn = match_fn
 
     def _match(self, forward_string: str) -> Optional[LexedElement]:
         """Use regexes to match chunks."""
+        if self.match_fn:
+            end = self.match_fn(forward_string, 0)
+            if end > 0:
+                return LexedElement(forward_string[:end], self)
+            return None
         match = self._compiled_regex.match(forward_string)
         if match:
             # We can only match strings with length
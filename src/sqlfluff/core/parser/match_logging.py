@@ -1,7 +1,22 @@
 """Classes to help with match logging."""
 
+import logging
+
 from sqlfluff.core.parser.helpers import join_segments_raw_curtailed
 
+# The logging levels which each v_level is logged at.
+_LOG_LEVELS = {3: logging.INFO, 4: logging.DEBUG}
+
+
+def is_logging_enabled(logger, v_level=3):
+    """Return whether anything logged at this v_level would be emitted.
+
+    Matching logs a great deal, so this allows us to skip even making
+    the late binding log objects when the logger won't use them.
+    """
+    level = _LOG_LEVELS.get(v_level)
+    return level is not None and logger.isEnabledFor(level)
+
 
 class LateLoggingObject:
     """A basic late binding log object for parse_match_logging.
@@ -24,10 +39,8 @@ class LateLoggingObject:
     def log(self):
         """Actually log this object."""
         # Otherwise carry on...
-        if self.v_level == 3:
-            self.logger.info(self)
-        elif self.v_level == 4:
-            self.logger.debug(self)
+        if self.v_level in _LOG_LEVELS:
+            self.logger.log(_LOG_LEVELS[self.v_level], self)
 
 
 class ParseMatchLogObject(LateLoggingObject):
@@ -74,9 +87,10 @@ class ParseMatchLogObject(LateLoggingObject):
 def parse_match_logging(grammar, func, msg, parse_context, v_level=3, **kwargs):
     """Log in a particular consistent format for use while matching."""
     # Make a late bound log object so we only do the string manipulation when we need to.
-    ParseMatchLogObject(
-        parse_context, grammar, func, msg, v_level=v_level, **kwargs
-    ).log()
+    if is_logging_enabled(parse_context.logger, v_level):
+        ParseMatchLogObject(
+            parse_context, grammar, func, msg, v_level=v_level, **kwargs
+        ).log()
 
 
 class LateBoundJoinSegmentsCurtailed:
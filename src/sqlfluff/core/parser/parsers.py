@@ -4,7 +4,7 @@ Matchable objects which return individual segments.
 """
 
 import re
-from typing import Type, Optional, List, Tuple, Union
+from typing import Collection, Type, Optional, List, Pattern, Tuple, Union
 
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.matchable import Matchable
@@ -55,16 +55,28 @@ class StringParser(Matchable):
         """Does the segment provided match according to the current rules."""
         # Is the target a match and IS IT CODE.
         # The latter stops us accidentally matching comments.
-        if self.template == segment.raw.upper() and segment.is_code:
+        if self.template == segment.raw_upper and segment.is_code:
             return True
         return False
 
-    def _make_match_from_first_result(self, segments: Tuple[BaseSegment, ...]):
+    def _make_match_from_first_result(
+        self, segments: Tuple[BaseSegment, ...], parse_context: ParseContext
+    ):
         """Make a MatchResult from the first segment in the given list.
 
         This is a helper function for reuse by other parsers.
         """
-        # Construct the segment object
+        # The same raw segment is often tried more than once by the same
+        # parser (e.g. when an enclosing grammar backtracks), and the result
+        # only depends on the matched segment, so if we've already made a
+        # segment from it in this parse we hand back the same object. The
+        # cache holds the parser and raw segment too, so that ids can't be
+        # confused if either were garbage collected.
+        key = (id(self), id(segments[0]))
+        cached = parse_context.parser_matches.get(key)
+        if cached and cached[0] is self and cached[1] is segments[0]:
+            return MatchResult((cached[2],), segments[1:])
+        # Otherwise construct the segment object
         new_seg = self.raw_class(
             raw=segments[0].raw,
             pos_marker=segments[0].pos_marker,
@@ -72,6 +84,7 @@ class StringParser(Matchable):
             name=self.name,
             **self.segment_kwargs,
         )
+        parse_context.parser_matches[key] = (self, segments[0], new_seg)
         # Return as a tuple
         return MatchResult((new_seg,), segments[1:])
 
@@ -100,10 +113,55 @@ class StringParser(Matchable):
                 return MatchResult((segments[0],), segments[1:])
             # Does it match?
             elif self._is_first_match(segments[0]):
-                return self._make_match_from_first_result(segments)
+                return self._make_match_from_first_result(segments, parse_context)
         return MatchResult.from_unmatched(segments)
 
 
+class MultiStringParser(StringParser):
+    """An object which matches and returns raw segments on a collection of strings.
+
+    This is equivalent to a OneOf of StringParsers, but checks all of the
+    strings with a single set lookup rather than trying each in turn.
+    """
+
+    def __init__(
+        self,
+        templates: Collection[str],
+        raw_class: Type[RawSegment],
+        name: Optional[str] = None,
+        type: Optional[str] = None,
+        optional: bool = False,
+        **segment_kwargs,
+    ):
+        # As with StringParser, matching is not case sensitive.
+        self.templates = frozenset(template.upper() for template in templates)
+        # The combined template is for reference only, matching uses the set.
+        super().__init__(
+            template="|".join(sorted(self.templates)),
+            raw_class=raw_class,
+            name=name,
+            type=type,
+            optional=optional,
+            **segment_kwargs,
+        )
+
+    def simple(self, parse_context: "ParseContext") -> Optional[List[str]]:
+        """Return simple options for this matcher.
+
+        Because string matchers are not case sensitive we can
+        just return the templates here.
+        """
+        return sorted(self.templates)
+
+    def _is_first_match(self, segment: BaseSegment):
+        """Does the segment provided match according to the current rules."""
+        # Is the target a match and IS IT CODE.
+        # The latter stops us accidentally matching comments.
+        if segment.raw_upper in self.templates and segment.is_code:
+            return True
+        return False
+
+
 class NamedParser(StringParser):
     """An object which matches and returns raw segments based on names."""
 
@@ -132,11 +190,16 @@ class NamedParser(StringParser):
 
 
 class RegexParser(StringParser):
-    """An object which matches and returns raw segments based on a regex."""
+    """An object which matches and returns raw segments based on a regex.
+
+    The template may be passed either as a string (which is uppercased and
+    compiled on creation) or as an already compiled pattern, which is used
+    as is. Either way, matching is against the uppercase raw of a segment.
+    """
 
     def __init__(
         self,
-        template: str,
+        template: Union[str, Pattern[str]],
         raw_class: Type[RawSegment],
         name: Optional[str] = None,
         type: Optional[str] = None,
@@ -147,13 +210,19 @@ class RegexParser(StringParser):
         # Store the optional anti-template
         self.anti_template = anti_template
         super().__init__(
-            template=template,
+            template=template if isinstance(template, str) else template.pattern,
             raw_class=raw_class,
             name=name,
             type=type,
             optional=optional,
             **segment_kwargs,
         )
+        # Compile the regexes once here, rather than on every match.
+        if isinstance(template, str):
+            self._template = re.compile(self.template)
+        else:
+            self._template = template
+        self._anti_template = re.compile(anti_template) if anti_template else None
 
     def simple(cls, parse_context: ParseContext) -> Optional[List[str]]:
         """Does this matcher support a uppercase hash matching route?
@@ -174,15 +243,13 @@ class RegexParser(StringParser):
             # In any case, it won't match here.
             return False
         # Try the regex. Case sensitivity is not supported.
-        result = re.match(self.template, segment.raw_upper)
+        result = self._template.match(segment.raw_upper)
         if result:
             result_string = result.group(0)
             # Check that we've fully matched
             if result_string == segment.raw_upper:
                 # Check that the anti_template (if set) hasn't also matched
-                if self.anti_template and re.match(
-                    self.anti_template, segment.raw_upper
-                ):
+                if self._anti_template and self._anti_template.match(segment.raw_upper):
                     return False
                 else:
                     return True
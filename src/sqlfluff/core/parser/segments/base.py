@@ -844,11 +844,16 @@ class BaseSegment:
                 self.__class__.__name__, parse_context.recurse
             )
         )
-        parse_depth_msg = "###\n#\n# Beginning Parse Depth {}: {}\n#\n###\nInitial Structure:\n{}".format(
-            parse_context.parse_depth + 1, self.__class__.__name__, self.stringify()
-        )
         if parse_context.may_recurse():
-            parse_context.logger.debug(parse_depth_msg)
+            # Only stringify if we're going to log it, as it's costly on large trees.
+            if parse_context.logger.isEnabledFor(logging.DEBUG):
+                parse_context.logger.debug(
+                    "###\n#\n# Beginning Parse Depth {}: {}\n#\n###\nInitial Structure:\n{}".format(
+                        parse_context.parse_depth + 1,
+                        self.__class__.__name__,
+                        self.stringify(),
+                    )
+                )
             with parse_context.deeper_parse() as ctx:
                 self.segments = self.expand(self.segments, parse_context=ctx)
 
@@ -482,11 +482,18 @@ class RuleSet:
                 else rule_config.get(rule).get(config_name)
             )
             valid_options = info_dict.get("validation")
-            if (
-                valid_options
-                and config_option not in valid_options
-                and config_option is not None
-            ):
+            if not valid_options or config_option is None:
+                continue
+            try:
+                is_valid = config_option in valid_options
+            except TypeError:
+                # Unhashable values (e.g. a list from a toml file) can't be
+                # looked up in a set of choices, but they're invalid anyway.
+                is_valid = False
+            if not is_valid:
+                if "validation_choices" in info_dict:
+                    # Report the choices in their documented order.
+                    valid_options = list(info_dict["validation_choices"])
                 raise ValueError(
                     (
                         "Invalid option '{}' for {} configuration. Must be one of {}"
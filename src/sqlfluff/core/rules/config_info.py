@@ -9,6 +9,16 @@ as document rule configuration.
 
 from sqlfluff.core.plugin.host import get_plugin_manager
 
+
+def _choices(*choices) -> dict:
+    """Validation for a config value which must be one of a set of choices.
+
+    The choices are stored as a frozenset for quick validation, and also
+    as a tuple, in the given order, for documentation.
+    """
+    return {"validation": frozenset(choices), "validation_choices": choices}
+
+
 STANDARD_CONFIG_INFO_DICT = {
     "tab_space_size": {
         "validation": range(100),
@@ -24,34 +34,34 @@ STANDARD_CONFIG_INFO_DICT = {
         ),
     },
     "indent_unit": {
-        "validation": ["space", "tab"],
+        **_choices("space", "tab"),
         "definition": "Whether to use tabs or spaces to add new indents",
     },
     "comma_style": {
-        "validation": ["leading", "trailing"],
+        **_choices("leading", "trailing"),
         "definition": "The comma style to to enforce",
     },
     "allow_scalar": {
-        "validation": [True, False],
+        **_choices(True, False),
         "definition": (
             "Whether or not to allow a single element in the "
             " select clause to be without an alias"
         ),
     },
     "single_table_references": {
-        "validation": ["consistent", "qualified", "unqualified"],
+        **_choices("consistent", "qualified", "unqualified"),
         "definition": "The expectation for references in single-table select",
     },
     "unquoted_identifiers_policy": {
-        "validation": ["all", "aliases", "column_aliases"],
+        **_choices("all", "aliases", "column_aliases"),
         "definition": "Types of unquoted identifiers to flag violations for",
     },
     "capitalisation_policy": {
-        "validation": ["consistent", "upper", "lower", "capitalise"],
+        **_choices("consistent", "upper", "lower", "capitalise"),
         "definition": "The capitalisation policy to enforce",
     },
     "extended_capitalisation_policy": {
-        "validation": ["consistent", "upper", "lower", "pascal", "capitalise"],
+        **_choices("consistent", "upper", "lower", "pascal", "capitalise"),
         "definition": (
             "The capitalisation policy to enforce, extended with PascalCase. "
             "This is separate from capitalisation_policy as it should not be "
@@ -59,39 +69,39 @@ STANDARD_CONFIG_INFO_DICT = {
         ),
     },
     "lint_templated_tokens": {
-        "validation": [True, False],
+        **_choices(True, False),
         "definition": (
             "Should lines starting with a templating placeholder"
             " such as `{{blah}}` have their indentation linted"
         ),
     },
     "select_clause_trailing_comma": {
-        "validation": ["forbid", "require"],
+        **_choices("forbid", "require"),
         "definition": (
             "Should trailing commas within select clauses be required or forbidden"
         ),
     },
     "ignore_comment_lines": {
-        "validation": [True, False],
+        **_choices(True, False),
         "definition": (
             "Should lines that contain only whitespace and comments"
             " be ignored when linting line lengths"
         ),
     },
     "forbid_subquery_in": {
-        "validation": ["join", "from", "both"],
+        **_choices("join", "from", "both"),
         "definition": "Which clauses should be linted for subqueries",
     },
     "prefer_count_1": {
-        "validation": [True, False],
+        **_choices(True, False),
         "definition": ("Should count(1) be preferred over count(*) and count(0)?"),
     },
     "prefer_count_0": {
-        "validation": [True, False],
+        **_choices(True, False),
         "definition": ("Should count(0) be preferred over count(*) and count(1)?"),
     },
     "operator_new_lines": {
-        "validation": ["before", "after"],
+        **_choices("before", "after"),
         "definition": ("Should operator be placed before or after newlines."),
     },
 }
@@ -101,6 +111,8 @@ def get_config_info() -> dict:
     """Gets the config from core sqlfluff and sqlfluff plugins and merges them."""
     plugin_manager = get_plugin_manager()
     configs_info = plugin_manager.hook.get_configs_info()
-    return {
-        k: v for config_info_dict in configs_info for k, v in config_info_dict.items()
-    }
+    # Later plugins take precedence over earlier ones for the same key.
+    merged: dict = {}
+    for config_info_dict in configs_info:
+        merged.update(config_info_dict)
+    return merged
@@ -50,7 +50,11 @@ def document_configuration(cls, ruleset="std"):
             config_doc += "\n    |     `{}`: {}.".format(
                 keyword, info_dict["definition"]
             )
-            if "validation" in info_dict:
+            if "validation_choices" in info_dict:
+                config_doc += " Must be one of {}.".format(
+                    list(info_dict["validation_choices"])
+                )
+            elif "validation" in info_dict:
                 config_doc += " Must be one of {}.".format(info_dict["validation"])
             config_doc += "\n    |"
     except AttributeError:
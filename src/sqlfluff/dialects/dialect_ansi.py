@@ -15,6 +15,8 @@ https://www.cockroachlabs.com/docs/stable/sql-grammar.html#select_stmt
 from enum import Enum
 from typing import Generator, List, Tuple, NamedTuple, Optional, Union
 
+from cached_property import cached_property
+
 from sqlfluff.core.parser import (
     Matchable,
     BaseSegment,
@@ -601,9 +603,19 @@ class ObjectReferenceSegment(BaseSegment):
         for elem in self.recursive_crawl("identifier"):
             yield from self._iter_reference_parts(elem)
 
+    @cached_property
+    def _raw_references(self) -> List[ObjectReferencePart]:
+        """The raw references, cached as rules may fetch several levels."""
+        return list(self.iter_raw_references())
+
+    def invalidate_caches(self):
+        """Invalidate the cached properties, including the raw references."""
+        super().invalidate_caches()
+        self.__dict__.pop("_raw_references", None)
+
     def is_qualified(self):
         """Return if there is more than one element to the reference."""
-        return len(list(self.iter_raw_references())) > 1
+        return len(self._raw_references) > 1
 
     def qualification(self):
         """Return the qualification type of this reference."""
@@ -639,7 +651,7 @@ class ObjectReferenceSegment(BaseSegment):
         multiple reference parts.
         """
         level = self._level_to_int(level)
-        refs = list(self.iter_raw_references())
+        refs = self._raw_references
         if len(refs) >= level:
             return [refs[-level]]
         return []
@@ -6,7 +6,7 @@ and
 https://cloud.google.com/bigquery/docs/reference/standard-sql/lexical#string_and_bytes_literals
 """
 
-import itertools
+import re
 
 from sqlfluff.core.parser import (
     Anything,
@@ -24,6 +24,7 @@ from sqlfluff.core.parser import (
     CodeSegment,
     NamedParser,
     StringParser,
+    MultiStringParser,
     RegexParser,
     Nothing,
     StartsWith,
@@ -37,6 +38,18 @@ from sqlfluff.core.dialects import load_raw_dialect
 ansi_dialect = load_raw_dialect("ansi")
 bigquery_dialect = ansi_dialect.copy_as("bigquery")
 
+# The ANSI elements which are extended below. Dialects should not use Python
+# "import" to access other dialects. Instead, get references to them this way
+# so we can inherit from or copy them.
+ObjectReferenceSegment = ansi_dialect.get_segment("ObjectReferenceSegment")
+_ansi_statement = ansi_dialect.get_segment("StatementSegment")
+_ansi_select_statement = ansi_dialect.get_segment("SelectStatementSegment")
+_ansi_wildcard_expression = ansi_dialect.get_segment("WildcardExpressionSegment")
+_ansi_table_expression = ansi_dialect.get_segment("TableExpressionSegment")
+_ansi_base_expression_element = ansi_dialect.get_grammar("BaseExpressionElementGrammar")
+_ansi_function_contents = ansi_dialect.get_grammar("FunctionContentsGrammar")
+_ansi_literal = ansi_dialect.get_grammar("LiteralGrammar")
+
 bigquery_dialect.insert_lexer_matchers(
     # JSON Operators: https://www.postgresql.org/docs/9.5/functions-json.html
     [
@@ -45,30 +58,95 @@ bigquery_dialect.insert_lexer_matchers(
     before="equals",
 )
 
+# Quoted literals can have r or b (case insensitive) prefixes, in any order, to
+# indicate a raw/regex string or byte sequence, respectively. For simplicity the
+# prefix is matched as up to two of these characters, as a repeated prefix (e.g.
+# rr) can't otherwise begin valid SQL.  Allow escaped quote characters inside
+# strings by allowing \" with an optional even multiple of backslashes in front
+# of it.
+# https://cloud.google.com/bigquery/docs/reference/standard-sql/lexical#string_and_bytes_literals
+# Triple quoted variant first, then single quoted. These are compiled once here
+# and handed to the lexer already compiled.
+_SINGLE_QUOTE_RE = re.compile(
+    r"[rRbB]{0,2}('''((?<!\\)(\\{2})*\\'|'{,2}(?!')|[^'])"
+    r"*(?<!\\)(\\{2})*'''|'((?<!\\)(\\{2})*\\'|[^'])*(?<!\\)(\\{2})*')",
+    re.DOTALL,
+)
+_DOUBLE_QUOTE_RE = re.compile(
+    r"[rRbB]{0,2}(\"\"\"((?<!\\)(\\{2})*\\\"|\"{,2}(?!\")"
+    r'|[^\"])*(?<!\\)(\\{2})*\"\"\"|"((?<!\\)(\\{2})*\\"|[^"])*(?<!\\)'
+    r'(\\{2})*")',
+    re.DOTALL,
+)
+
+_QUOTE_PREFIXES = ("r", "R", "b", "B")
+
+
+def _bigquery_quoted_match(src: str, pos: int, quote: str) -> int:
+    """Match a BigQuery quoted literal at `pos`, returning its end or -1.
+
+    This matches the same literals as `_SINGLE_QUOTE_RE` and
+    `_DOUBLE_QUOTE_RE`, but in a single linear pass through the states:
+    prefix (up to two of rRbB) -> opening quote (triple or single) ->
+    body -> closing quote. Within the body, str.find jumps straight to
+    the next quote, which only closes the literal if it is preceded by
+    an even number of backslashes.
+    """
+    # Prefix: optional raw and/or bytes prefix, in either order. Most
+    # positions aren't the start of a literal at all, so bail early.
+    if src.startswith(_QUOTE_PREFIXES, pos):
+        pos += 1
+        if src.startswith(_QUOTE_PREFIXES, pos):
+            pos += 1
+        if not src.startswith(quote, pos):
+            return -1
+    elif not src.startswith(quote, pos):
+        return -1
+    # Opening quote: triple quoted variant first, then single quoted.
+    delimiter = quote * 3 if src.startswith(quote * 3, pos) else quote
+    # Body: look for the closing quote.
+    body_start = end = pos + len(delimiter)
+    while True:
+        end = src.find(quote, end)
+        if end < 0:
+            break
+        # Count the backslashes immediately before the quote. An odd
+        # number means the quote itself is escaped.
+        escapes = 0
+        while end - escapes > body_start and src[end - escapes - 1] == "\\":
+            escapes += 1
+        if not escapes % 2 and src.startswith(delimiter, end):
+            return end + len(delimiter)
+        end += 1
+    if len(delimiter) == 3:
+        # An unclosed triple quote still starts with an empty single
+        # quoted literal.
+        return pos + 2
+    return -1
+
+
 bigquery_dialect.patch_lexer_matchers(
     [
-        # Quoted literals can have r or b (case insensitive) prefixes, in any order, to
-        # indicate a raw/regex string or byte sequence, respectively.  Allow escaped quote
-        # characters inside strings by allowing \" with an optional even multiple of
-        # backslashes in front of it.
-        # https://cloud.google.com/bigquery/docs/reference/standard-sql/lexical#string_and_bytes_literals
-        # Triple quoted variant first, then single quoted
         RegexLexer(
             "single_quote",
-            r"([rR]?[bB]?|[bB]?[rR]?)?('''((?<!\\)(\\{2})*\\'|'{,2}(?!')|[^'])"
-            r"*(?<!\\)(\\{2})*'''|'((?<!\\)(\\{2})*\\'|[^'])*(?<!\\)(\\{2})*')",
+            _SINGLE_QUOTE_RE,
             CodeSegment,
+            match_fn=lambda src, pos: _bigquery_quoted_match(src, pos, "'"),
         ),
         RegexLexer(
             "double_quote",
-            r"([rR]?[bB]?|[bB]?[rR]?)?(\"\"\"((?<!\\)(\\{2})*\\\"|\"{,2}(?!\")"
-            r'|[^\"])*(?<!\\)(\\{2})*\"\"\"|"((?<!\\)(\\{2})*\\"|[^"])*(?<!\\)'
-            r'(\\{2})*")',
+            _DOUBLE_QUOTE_RE,
             CodeSegment,
+            match_fn=lambda src, pos: _bigquery_quoted_match(src, pos, '"'),
         ),
     ]
 )
 
+# Patterns for names used in several RegexParsers, compiled once here.
+# These are matched against the uppercase raw of a segment.
+_NAKED_NAME_RE = re.compile(r"[A-Z_][A-Z0-9_]*")
+_BACK_QUOTED_NAME_RE = re.compile(r"`[^`]*`")
+
 bigquery_dialect.add(
     DoubleQuotedLiteralSegment=NamedParser(
         "double_quote",
@@ -114,7 +192,11 @@ bigquery_dialect.replace(
         Ref("DatetimeUnitSegment"),
         Sequence(
             Ref("ExpressionSegment"),
-            Sequence(OneOf("IGNORE", "RESPECT"), "NULLS", optional=True),
+            Sequence(
+                MultiStringParser(["IGNORE", "RESPECT"], KeywordSegment),
+                "NULLS",
+                optional=True,
+            ),
         ),
         Ref("NamedArgumentSegment"),
     ),
@@ -127,19 +209,19 @@ bigquery_dialect.replace(
         ),
     ),
     # BigQuery also supports the special "Struct" construct.
-    BaseExpressionElementGrammar=ansi_dialect.get_grammar(
-        "BaseExpressionElementGrammar"
-    ).copy(insert=[Ref("TypelessStructSegment")]),
-    FunctionContentsGrammar=ansi_dialect.get_grammar("FunctionContentsGrammar").copy(
+    BaseExpressionElementGrammar=_ansi_base_expression_element.copy(
+        insert=[Ref("TypelessStructSegment")]
+    ),
+    FunctionContentsGrammar=_ansi_function_contents.copy(
         insert=[Ref("TypelessStructSegment")],
         before=Ref("ExpressionSegment"),
     ),
     # BigQuery allows underscore in parameter names, and also anything if quoted in backticks
     ParameterNameSegment=OneOf(
+        RegexParser(_NAKED_NAME_RE, CodeSegment, name="parameter", type="parameter"),
         RegexParser(
-            r"[A-Z_][A-Z0-9_]*", CodeSegment, name="parameter", type="parameter"
+            _BACK_QUOTED_NAME_RE, CodeSegment, name="parameter", type="parameter"
         ),
-        RegexParser(r"`[^`]*`", CodeSegment, name="parameter", type="parameter"),
     ),
     DateTimeLiteralGrammar=Nothing(),
 )
@@ -152,10 +234,10 @@ bigquery_dialect.sets("datetime_units").update(
 )
 
 # Unreserved Keywords
-bigquery_dialect.sets("unreserved_keywords").add("SYSTEM_TIME")
+bigquery_dialect.sets("unreserved_keywords").update(
+    ["SYSTEM_TIME", "STRUCT", "ORDINAL"]
+)
 bigquery_dialect.sets("unreserved_keywords").remove("FOR")
-bigquery_dialect.sets("unreserved_keywords").add("STRUCT")
-bigquery_dialect.sets("unreserved_keywords").add("ORDINAL")
 # Reserved Keywords
 bigquery_dialect.sets("reserved_keywords").add("FOR")
 
@@ -199,13 +281,12 @@ class SelectStatementSegment(BaseSegment):
     """Enhance`SELECT` statement to include QUALIFY."""
 
     type = "select_statement"
-    match_grammar = ansi_dialect.get_segment(
-        "SelectStatementSegment"
-    ).match_grammar.copy()
 
-    parse_grammar = ansi_dialect.get_segment(
-        "SelectStatementSegment"
-    ).parse_grammar.copy(
+    # The ANSI match grammar is used unchanged, and grammars aren't mutated
+    # once built, so we share it rather than copying it.
+    match_grammar = _ansi_select_statement.match_grammar
+
+    parse_grammar = _ansi_select_statement.parse_grammar.copy(
         insert=[Ref("QualifyClauseSegment", optional=True)],
         before=Ref("OrderByClauseSegment", optional=True),
     )
@@ -229,10 +310,10 @@ class ArrayLiteralSegment(BaseSegment):
 
 
 @bigquery_dialect.segment(replace=True)
-class StatementSegment(ansi_dialect.get_segment("StatementSegment")):  # type: ignore
+class StatementSegment(_ansi_statement):  # type: ignore
     """Overriding StatementSegment to allow for additional segment parsing."""
 
-    parse_grammar = ansi_dialect.get_segment("StatementSegment").parse_grammar.copy(
+    parse_grammar = _ansi_statement.parse_grammar.copy(
         insert=[Ref("DeclareStatementSegment"), Ref("SetStatementSegment")],
     )
 
@@ -244,8 +325,12 @@ class SelectClauseModifierSegment(BaseSegment):
     type = "select_clause_modifier"
     match_grammar = Sequence(
         # https://cloud.google.com/bigquery/docs/reference/standard-sql/query-syntax
-        Sequence("AS", OneOf("STRUCT", "VALUE"), optional=True),
-        OneOf("DISTINCT", "ALL", optional=True),
+        Sequence(
+            "AS",
+            MultiStringParser(["STRUCT", "VALUE"], KeywordSegment),
+            optional=True,
+        ),
+        MultiStringParser(["DISTINCT", "ALL"], KeywordSegment, optional=True),
     )
 
 
@@ -271,7 +356,7 @@ bigquery_dialect.replace(
         trim_chars=("`",),
     ),
     # Add two elements to the ansi LiteralGrammar
-    LiteralGrammar=ansi_dialect.get_grammar("LiteralGrammar").copy(
+    LiteralGrammar=_ansi_literal.copy(
         insert=[Ref("DoubleQuotedLiteralSegment"), Ref("LiteralCoercionSegment")]
     ),
     PostTableExpressionGrammar=Sequence(
@@ -283,14 +368,14 @@ bigquery_dialect.replace(
     FunctionNameIdentifierSegment=OneOf(
         # In BigQuery struct() has a special syntax, so we don't treat it as a function
         RegexParser(
-            r"[A-Z_][A-Z0-9_]*",
+            _NAKED_NAME_RE,
             CodeSegment,
             name="function_name_identifier",
             type="function_name_identifier",
             anti_template=r"STRUCT",
         ),
         RegexParser(
-            r"`[^`]*`",
+            _BACK_QUOTED_NAME_RE,
             CodeSegment,
             name="function_name_identifier",
             type="function_name_identifier",
@@ -325,10 +410,7 @@ class FunctionSegment(BaseSegment):
             # OFFSET or ORDINAL clauses
             Sequence(
                 Bracketed(
-                    OneOf(
-                        "OFFSET",
-                        "ORDINAL",
-                    ),
+                    MultiStringParser(["OFFSET", "ORDINAL"], KeywordSegment),
                     Bracketed(
                         Ref("NumericLiteralSegment"),
                     ),
@@ -407,9 +489,8 @@ class WildcardExpressionSegment(BaseSegment):
     """An extension of the star expression for Bigquery."""
 
     type = "wildcard_expression"
-    match_grammar = ansi_dialect.get_segment(
-        "WildcardExpressionSegment"
-    ).match_grammar.copy(
+
+    match_grammar = _ansi_wildcard_expression.match_grammar.copy(
         insert=[
             # Optional EXCEPT or REPLACE clause
             # https://cloud.google.com/bigquery/docs/reference/standard-sql/query-syntax#select_replace
@@ -566,17 +647,11 @@ class LiteralCoercionSegment(BaseSegment):
 
     type = "cast_expression"
     match_grammar = Sequence(
-        OneOf("DATE", "DATETIME", "TIME", "TIMESTAMP"),
+        MultiStringParser(["DATE", "DATETIME", "TIME", "TIMESTAMP"], KeywordSegment),
         Ref("QuotedLiteralSegment"),
     )
 
 
-# Dialects should not use Python "import" to access other dialects. Instead,
-# get a reference to the ANSI ObjectReferenceSegment this way so we can inherit
-# from it.
-ObjectReferenceSegment = ansi_dialect.get_segment("ObjectReferenceSegment")
-
-
 @bigquery_dialect.segment(replace=True)
 class ColumnReferenceSegment(ObjectReferenceSegment):  # type: ignore
     """A reference to column, field or alias."""
@@ -586,7 +661,7 @@ class ColumnReferenceSegment(ObjectReferenceSegment):  # type: ignore
     def extract_possible_references(self, level):
         """Extract possible references of a given level."""
         level = self._level_to_int(level)
-        refs = list(self.iter_raw_references())
+        refs = self._raw_references
         if level == self.ObjectReferenceLevel.SCHEMA.value and len(refs) >= 3:
             return [refs[0]]
         if level == self.ObjectReferenceLevel.TABLE.value and len(refs) >= 3:
@@ -605,9 +680,8 @@ class HyphenatedObjectReferenceSegment(ObjectReferenceSegment):  # type: ignore
     """A reference to an object that may contain embedded hyphens."""
 
     type = "hyphenated_object_reference"
-    match_grammar = ansi_dialect.get_segment(
-        "ObjectReferenceSegment"
-    ).match_grammar.copy()
+
+    match_grammar = ObjectReferenceSegment.match_grammar.copy()
     match_grammar.delimiter = OneOf(
         Ref("DotSegment"),
         Sequence(Ref("DotSegment"), Ref("DotSegment")),
@@ -623,15 +697,21 @@ class HyphenatedObjectReferenceSegment(ObjectReferenceSegment):  # type: ignore
         segments.
         """
         # For each descendant element, group them, using "dot" elements as a
-        # delimiter.
-        for is_dot, elems in itertools.groupby(
-            self.recursive_crawl("identifier", "binary_operator", "dot"),
-            lambda e: e.is_type("dot"),
-        ):
-            if not is_dot:
-                segments = list(elems)
-                parts = [seg.raw_trimmed() for seg in segments]
-                yield self.ObjectReferencePart("".join(parts), segments)
+        # delimiter. These are all raw segments, so comparing get_type() is
+        # enough here and avoids walking the class hierarchy in is_type().
+        parts = []
+        segments = []
+        for elem in self.recursive_crawl("identifier", "binary_operator", "dot"):
+            if elem.get_type() == "dot":
+                if segments:
+                    yield self.ObjectReferencePart("".join(parts), segments)
+                    parts = []
+                    segments = []
+            else:
+                parts.append(elem.raw_trimmed())
+                segments.append(elem)
+        if segments:
+            yield self.ObjectReferencePart("".join(parts), segments)
 
 
 @bigquery_dialect.segment(replace=True)
@@ -639,15 +719,25 @@ class TableExpressionSegment(BaseSegment):
     """Main table expression e.g. within a FROM clause, with hyphen support."""
 
     type = "table_expression"
-    match_grammar = ansi_dialect.get_segment(
-        "TableExpressionSegment"
-    ).match_grammar.copy(
+
+    match_grammar = _ansi_table_expression.match_grammar.copy(
         insert=[
             Ref("HyphenatedObjectReferenceSegment"),
         ]
     )
 
 
+bigquery_dialect.add(
+    # The value of a variable in a DECLARE ... DEFAULT or SET statement.
+    ScriptingValueGrammar=OneOf(
+        Ref("LiteralGrammar"),
+        Bracketed(Ref("SelectStatementSegment")),
+        Ref("BareFunctionSegment"),
+        Ref("FunctionSegment"),
+    ),
+)
+
+
 @bigquery_dialect.segment()
 class DeclareStatementSegment(BaseSegment):
     """Declaration of a variable.
@@ -663,12 +753,7 @@ class DeclareStatementSegment(BaseSegment):
         Ref("DatatypeIdentifierSegment"),
         Sequence(
             "DEFAULT",
-            OneOf(
-                Ref("LiteralGrammar"),
-                Bracketed(Ref("SelectStatementSegment")),
-                Ref("BareFunctionSegment"),
-                Ref("FunctionSegment"),
-            ),
+            Ref("ScriptingValueGrammar"),
             optional=True,
         ),
     )
@@ -693,20 +778,8 @@ class SetStatementSegment(BaseSegment):
         OneOf(
             Delimited(
                 OneOf(
-                    Ref("LiteralGrammar"),
-                    Bracketed(Ref("SelectStatementSegment")),
-                    Ref("BareFunctionSegment"),
-                    Ref("FunctionSegment"),
-                    Bracketed(
-                        Delimited(
-                            OneOf(
-                                Ref("LiteralGrammar"),
-                                Bracketed(Ref("SelectStatementSegment")),
-                                Ref("BareFunctionSegment"),
-                                Ref("FunctionSegment"),
-                            )
-                        )
-                    ),
+                    Ref("ScriptingValueGrammar"),
+                    Bracketed(Delimited(Ref("ScriptingValueGrammar"))),
                 )
             )
         ),
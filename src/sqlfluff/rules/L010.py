@@ -185,7 +185,7 @@ class Rule_L010(BaseRule):
         self.cap_policy = getattr(self, cap_policy_name)
         self.cap_policy_opts = [
             opt
-            for opt in get_config_info()[cap_policy_name]["validation"]
+            for opt in get_config_info()[cap_policy_name]["validation_choices"]
             if opt != "consistent"
         ]
         self.logger.debug(
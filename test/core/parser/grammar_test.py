@@ -2,15 +2,18 @@
 
 import pytest
 import logging
+import re
 
 from sqlfluff.core.parser import (
     KeywordSegment,
     StringParser,
     SymbolSegment,
     RegexParser,
+    MultiStringParser,
     WhitespaceSegment,
     Indent,
 )
+from sqlfluff.core.dialects import load_raw_dialect
 from sqlfluff.core.parser.context import RootParseContext
 from sqlfluff.core.parser.segments import EphemeralSegment, BaseSegment
 from sqlfluff.core.parser.grammar.base import BaseGrammar
@@ -311,6 +314,32 @@ def test__parser__grammar__base__bracket_fail_with_unexpected_end_bracket(
         assert not isinstance(segs[5], KeywordSegment)
 
 
+def test__parser__grammar__bracket_pair_lookup(fresh_ansi_dialect):
+    """Test looking up bracket pairs by type on the dialect."""
+    assert fresh_ansi_dialect.get_bracket_pair("round") == (
+        "StartBracketSegment",
+        "EndBracketSegment",
+        True,
+    )
+    # The lookup for each set is built once and then reused.
+    lookup = fresh_ansi_dialect._bracket_pair_lookups["bracket_pairs"]
+    assert fresh_ansi_dialect.get_bracket_pair("square")[0] == (
+        "StartSquareBracketSegment"
+    )
+    assert fresh_ansi_dialect._bracket_pair_lookups["bracket_pairs"] is lookup
+    # Other sets get their own lookup.
+    with pytest.raises(ValueError):
+        fresh_ansi_dialect.get_bracket_pair("round", "angle_bracket_pairs")
+    assert "angle_bracket_pairs" in fresh_ansi_dialect._bracket_pair_lookups
+    assert len(fresh_ansi_dialect._bracket_pair_lookups) == 2
+
+
+def test__parser__grammar__bracket_pair_lookup_unexpanded():
+    """Test looking up bracket pairs requires an expanded dialect."""
+    with pytest.raises(RuntimeError):
+        load_raw_dialect("ansi").get_bracket_pair("round")
+
+
 def test__parser__grammar__ref_eq():
     """Test equality of Ref Grammars."""
     r1 = Ref("foo")
@@ -393,6 +422,57 @@ def test__parser__grammar_oneof_exclude(seg_list):
         assert not g.match(seg_list, parse_context=ctx)
 
 
+def test__parser__multistringparser(seg_list):
+    """Test that the MultiStringParser matches any of its strings."""
+    foo_or_bar = MultiStringParser(["foo", "BAR"], KeywordSegment)
+    with RootParseContext(dialect=None) as ctx:
+        assert foo_or_bar.simple(ctx) == ["BAR", "FOO"]
+        # Matches the first segment, whichever template it is.
+        assert foo_or_bar.match(seg_list, parse_context=ctx).matched_segments == (
+            KeywordSegment("bar", seg_list[0].pos_marker),
+        )
+        assert foo_or_bar.match(seg_list[2:], parse_context=ctx).matched_segments == (
+            KeywordSegment("foo", seg_list[2].pos_marker),
+        )
+        # Doesn't match non-code or other strings.
+        assert not foo_or_bar.match(seg_list[1:], parse_context=ctx)
+        assert not foo_or_bar.match(seg_list[3:], parse_context=ctx)
+
+
+def test__parser__stringparser_reuses_match(seg_list):
+    """Test that the StringParser reuses the segment made on a repeat match."""
+    bar = StringParser("bar", KeywordSegment)
+    root_ctx = RootParseContext(dialect=None)
+    with root_ctx as ctx:
+        first = bar.match(seg_list, parse_context=ctx).matched_segments[0]
+        # Matching the same segment again gives back the same object.
+        assert bar.match(seg_list, parse_context=ctx).matched_segments[0] is first
+        # Matching a different (but equal) segment makes a new one.
+        other = bar.match(
+            (seg_list[0].edit("bar"),), parse_context=ctx
+        ).matched_segments[0]
+        assert other == first
+        assert other is not first
+    # The made segments aren't held on to once the parse is done.
+    assert not root_ctx.parser_matches
+    # And a new parse makes its own.
+    with RootParseContext(dialect=None) as ctx:
+        assert bar.match(seg_list, parse_context=ctx).matched_segments[0] is not first
+
+
+def test__parser__regexparser_precompiled(seg_list):
+    """Test that the RegexParser accepts an already compiled pattern."""
+    pattern = re.compile(r"FO{2}")
+    fooRegex = RegexParser(pattern, KeywordSegment)
+    assert fooRegex._template is pattern
+    with RootParseContext(dialect=None) as ctx:
+        assert fooRegex.match(seg_list[2:], parse_context=ctx).matched_segments == (
+            KeywordSegment("foo", seg_list[2].pos_marker),
+        )
+        # Only full matches count.
+        assert not fooRegex.match(seg_list[3:], parse_context=ctx)
+
+
 def test__parser__grammar_oneof_take_longest_match(seg_list):
     """Test that the OneOf grammar takes the longest match."""
     fooRegex = RegexParser(r"fo{2}", KeywordSegment)
@@ -474,6 +554,20 @@ def test__parser__grammar_startswith_b(
             assert len(m) == match_length
 
 
+def test__parser__grammar_startswith_simple_prune(seg_list, fresh_ansi_dialect):
+    """Test the StartsWith grammar rules out a simple target without matching it."""
+
+    class NeverMatchParser(StringParser):
+        """A parser which should never get as far as being matched."""
+
+        def match(self, segments, parse_context):
+            raise AssertionError("Simple target should have been pruned.")
+
+    grammar = StartsWith(NeverMatchParser("foo", KeywordSegment))
+    with RootParseContext(dialect=fresh_ansi_dialect) as ctx:
+        assert not grammar.match(seg_list, parse_context=ctx)
+
+
 def test__parser__grammar_sequence(seg_list, caplog):
     """Test the Sequence grammar."""
     bs = StringParser("bar", KeywordSegment)
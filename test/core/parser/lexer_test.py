@@ -2,6 +2,7 @@
 
 import pytest
 import logging
+import re
 
 from sqlfluff.core.parser import Lexer, CodeSegment
 from sqlfluff.core.parser.lexer import (
@@ -102,6 +103,27 @@ def test__parser__lexer_regex(raw, reg, res, caplog):
         assert_matches(raw, matcher, res)
 
 
+def test__parser__lexer_regex_precompiled():
+    """Test the RegexLexer uses an already compiled pattern as is."""
+    pattern = re.compile(r"'[^']*'", re.DOTALL)
+    matcher = RegexLexer("test", pattern, CodeSegment)
+    assert matcher._compiled_regex is pattern
+    assert_matches("'some\nthing' fsaljk", matcher, "'some\nthing'")
+    assert_matches("fsaljk", matcher, None)
+
+
+def test__parser__lexer_regex_match_fn():
+    """Test the RegexLexer uses a match_fn in place of the regex if given."""
+    matcher = RegexLexer(
+        "test",
+        r"[fas]*",
+        CodeSegment,
+        match_fn=lambda src, pos: src.find("l", pos),
+    )
+    assert_matches("fsaljk", matcher, "fsa")
+    assert_matches("fsajk", matcher, None)
+
+
 def test__parser__lexer_lex_match(caplog):
     """Test the RepeatedMultiMatcher."""
     matchers = [
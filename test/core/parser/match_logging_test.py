@@ -0,0 +1,18 @@
+"""The Test file for the match logging helpers."""
+
+import logging
+
+from sqlfluff.core.parser.match_logging import is_logging_enabled
+
+
+def test__parser__match_logging_is_logging_enabled(caplog):
+    """Test whether logging is enabled follows the level of the logger."""
+    logger = logging.getLogger("sqlfluff.parser")
+    with caplog.at_level(logging.INFO, logger="sqlfluff.parser"):
+        # v_level 3 logs at INFO, and v_level 4 at DEBUG.
+        assert is_logging_enabled(logger, v_level=3)
+        assert not is_logging_enabled(logger, v_level=4)
+        # Other v_levels aren't logged at all.
+        assert not is_logging_enabled(logger, v_level=5)
+    with caplog.at_level(logging.DEBUG, logger="sqlfluff.parser"):
+        assert is_logging_enabled(logger, v_level=4)
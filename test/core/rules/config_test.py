@@ -146,3 +146,27 @@ def test_rule_set_return_informative_error_when_rule_not_registered():
         get_rule_from_set("L000", config=cfg)
 
     e.match("'L000' not in")
+
+
+def test_rule_set_invalid_config_option_lists_choices():
+    """Assert that an invalid config option reports the choices in order."""
+    cfg = FluffConfig(configs={"rules": {"comma_style": "middle"}})
+    with pytest.raises(ValueError) as e:
+        get_ruleset().get_rulelist(config=cfg)
+
+    e.match(
+        r"Invalid option 'middle' for comma_style configuration. "
+        r"Must be one of \['leading', 'trailing'\]"
+    )
+
+
+def test_rule_set_invalid_config_option_unhashable():
+    """Assert that an unhashable config option is reported as invalid."""
+    cfg = FluffConfig(configs={"rules": {"comma_style": ["leading"]}})
+    with pytest.raises(ValueError) as e:
+        get_ruleset().get_rulelist(config=cfg)
+
+    e.match(
+        r"Invalid option '\['leading'\]' for comma_style configuration. "
+        r"Must be one of \['leading', 'trailing'\]"
+    )
@@ -2,6 +2,7 @@
 
 import pytest
 import logging
+from unittest.mock import patch
 
 from sqlfluff.core import FluffConfig, Linter
 from sqlfluff.core.parser import Lexer
@@ -213,3 +214,26 @@ def test__dialect__ansi_parse_indented_joins(sql_string, indented_joins, meta_lo
         idx for idx, raw_seg in enumerate(parsed.tree.iter_raw_seg()) if raw_seg.is_meta
     )
     assert res_meta_locs == meta_loc
+
+
+def test__dialect__ansi_object_reference_caching():
+    """Test the raw references of an object reference are cached."""
+    lnt = Linter(dialect="ansi")
+    parsed = lnt.parse_string("SELECT tbl.col FROM tbl").tree
+    col_ref = next(parsed.recursive_crawl("column_reference"))
+    table_refs = col_ref.extract_possible_references(
+        level=col_ref.ObjectReferenceLevel.TABLE
+    )
+    assert [ref.part for ref in table_refs] == ["tbl"]
+    # Further lookups use the cached references rather than crawling again.
+    with patch.object(type(col_ref), "iter_raw_references") as mock_iter:
+        object_refs = col_ref.extract_possible_references(
+            level=col_ref.ObjectReferenceLevel.OBJECT
+        )
+        assert col_ref.is_qualified()
+        mock_iter.assert_not_called()
+    assert [ref.part for ref in object_refs] == ["col"]
+    # Invalidating the caches means the references are crawled again.
+    col_ref.invalidate_caches()
+    with patch.object(type(col_ref), "iter_raw_references", return_value=iter([])):
+        assert not col_ref.is_qualified()
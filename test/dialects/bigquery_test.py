@@ -1,6 +1,7 @@
 """Tests specific to the snowflake dialect."""
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import example, given, note, settings
 
 from sqlfluff.core.parser import Parser, Lexer
@@ -53,3 +54,24 @@ def test_bigquery_relational_operator_parsing(data):
     # Check that there's nothing un parsable
     typs = parsed.type_set()
     assert "unparsable" not in typs
+
+
+@pytest.mark.parametrize(
+    "raw,res",
+    [
+        ("'abc' x", ["'abc'", " ", "x"]),
+        (r"r'a\'b' x", [r"r'a\'b'", " ", "x"]),
+        (r"'a\\' x", [r"'a\\'", " ", "x"]),
+        ("BR'''a''b''' x", ["BR'''a''b'''", " ", "x"]),
+        (r'"a\"b" x', [r'"a\"b"', " ", "x"]),
+        ('"""a\n"b""" x', ['"""a\n"b"""', " ", "x"]),
+        # A long run of backslashes shouldn't take exponential time to lex.
+        ("'" + "\\" * 5000 + "' x", ["'" + "\\" * 5000 + "'", " ", "x"]),
+    ],
+)
+def test_bigquery_quoted_literal_lexing(raw, res):
+    """Tests lexing of the different forms of quoted literal."""
+    config = FluffConfig(overrides=dict(dialect="bigquery"))
+    tokens, lex_vs = Lexer(config=config).lex(raw)
+    assert not lex_vs
+    assert [token.raw for token in tokens if token.raw] == res